@@ -6,13 +6,19 @@ This script validates inputs and sets up the generated project.
 
 import os
 import sys
-import json
 from pathlib import Path
 
+# Prefer orjson when available; the stdlib parser also accepts bytes
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 # Add scripts directory to path - fix the path resolution
 template_dir = Path(__file__).parent.parent
 scripts_dir = template_dir / "scripts"
-sys.path.insert(0, str(scripts_dir))
+if str(scripts_dir) not in sys.path:
+    sys.path.insert(0, str(scripts_dir))
 
 try:
     from logger import logger
@@ -31,125 +37,152 @@ except ImportError:
     
     print("⚠️  Warning: Using fallback logging and validation")
 
+# Resolve the version detector once, while scripts_dir is on the path
+_version_detector_error = None
+try:
+    import version_detector as _version_detector
+except Exception as e:
+    _version_detector = None
+    _version_detector_error = e
+
+# Files every generated project must contain
+_REQUIRED_FILES = (
+    "app/build.gradle.kts",
+    "app/src/main/java",
+    "app/src/main/AndroidManifest.xml",
+    "build.gradle.kts",
+    "settings.gradle.kts",
+    "gradlew",
+    "gradlew.bat",
+)
+
+# Output is collected here and written in one call per section
+_output_lines = []
+
+def out(line: str = ""):
+    """Queue a line of output."""
+    _output_lines.append(line)
+
+def flush_output():
+    """Write all queued output to stdout in a single call."""
+    if _output_lines:
+        sys.stdout.write("\n".join(_output_lines) + "\n")
+        _output_lines.clear()
+
 def main():
     """Main function to handle post-generation tasks."""
-    print("\n" + "="*50)
-    print("🚀 Android Hello World Template Generation")
-    print("="*50)
-    
-    # Get the project directory (current working directory after cookiecutter generation)
-    project_dir = os.getcwd()
-    project_name = os.path.basename(project_dir)
-    
-    print(f"Project directory: {project_dir}")
-    print(f"Project name: {project_name}")
-    
-    # Load cookiecutter context
-    context_file = Path(project_dir) / "cookiecutter_context.json"
-    if context_file.exists():
-        print("\n📌 Loading Template Context")
-        with open(context_file, 'r') as f:
-            context = json.load(f)
+    try:
+        out("\n" + "="*50)
+        out("🚀 Android Hello World Template Generation")
+        out("="*50)
+        
+        # Get the project directory (current working directory after cookiecutter generation)
+        project_dir = os.getcwd()
+        project_path = Path(project_dir)
+        project_name = os.path.basename(project_dir)
+        
+        out(f"Project directory: {project_dir}")
+        out(f"Project name: {project_name}")
+        flush_output()
+        
+        # Load cookiecutter context
+        context_file = project_path / "cookiecutter_context.json"
+        if context_file.exists():
+            out("\n📌 Loading Template Context")
+            context = json_loads(context_file.read_bytes())
+            
+            out("✅ Template context loaded successfully")
+            
+            # Validate inputs
+            out("\n📌 Validating Template Inputs")
+            flush_output()
+            is_valid, errors, warnings = validate_template_inputs(context)
+            
+            if not is_valid:
+                out("❌ Template validation failed!")
+                out("Please fix the errors and regenerate the template.")
+                sys.exit(1)
+            
+            if warnings:
+                out("⚠️  Template generated with warnings. Please review:")
+                for warning in warnings:
+                    out(f"  - {warning}")
+            
+            out("✅ Template validation completed successfully!")
+            
+        else:
+            out("⚠️  Template context file not found, skipping validation")
+            context = {}
         
-        print("✅ Template context loaded successfully")
+        # Project setup steps
+        out("\n📌 Project Setup")
         
-        # Validate inputs
-        print("\n📌 Validating Template Inputs")
-        is_valid, errors, warnings = validate_template_inputs(context)
+        # Step 1: Verify project structure
+        out("📋 Step 1/3: Verifying project structure")
+        missing_files = [
+            file_path for file_path in _REQUIRED_FILES
+            if not (project_path / file_path).exists()
+        ]
         
-        if not is_valid:
-            print("❌ Template validation failed!")
-            print("Please fix the errors and regenerate the template.")
+        if missing_files:
+            out(f"❌ Missing required files: {missing_files}")
             sys.exit(1)
         
-        if warnings:
-            print("⚠️  Template generated with warnings. Please review:")
-            for warning in warnings:
-                print(f"  - {warning}")
+        out("✅ Project structure verified")
         
-        print("✅ Template validation completed successfully!")
+        # Step 2: Generate requirements file
+        out("📋 Step 2/3: Generating requirements file")
+        if _version_detector is None:
+            out(f"⚠️  Could not generate requirements file: {_version_detector_error}")
+        else:
+            try:
+                requirements_content = _version_detector.generate_requirements_md()
+                
+                requirements_file = project_path / "REQUIREMENTS.md"
+                requirements_file.write_text(requirements_content, encoding="utf-8")
+                
+                out("✅ Requirements file generated: REQUIREMENTS.md")
+            except Exception as e:
+                out(f"⚠️  Could not generate requirements file: {e}")
         
-    else:
-        print("⚠️  Template context file not found, skipping validation")
-        context = {}
-    
-    # Project setup steps
-    print("\n📌 Project Setup")
-    
-    # Step 1: Verify project structure
-    print("📋 Step 1/3: Verifying project structure")
-    required_files = [
-        "app/build.gradle.kts",
-        "app/src/main/java",
-        "app/src/main/AndroidManifest.xml",
-        "build.gradle.kts",
-        "settings.gradle.kts",
-        "gradlew",
-        "gradlew.bat"
-    ]
-    
-    missing_files = []
-    for file_path in required_files:
-        if not Path(project_dir) / file_path:
-            missing_files.append(file_path)
-    
-    if missing_files:
-        print(f"❌ Missing required files: {missing_files}")
-        sys.exit(1)
-    
-    print("✅ Project structure verified")
-    
-    # Step 2: Generate requirements file
-    print("📋 Step 2/3: Generating requirements file")
-    try:
-        # Try to import and run version detector
-        sys.path.insert(0, str(scripts_dir))
-        from version_detector import generate_requirements_md
-        requirements_content = generate_requirements_md()
+        # Step 3: Clean up temporary files
+        out("📋 Step 3/3: Cleaning up temporary files")
+        if context_file.exists():
+            context_file.unlink()
+            out("✅ Temporary files cleaned up")
+        flush_output()
         
-        requirements_file = Path(project_dir) / "REQUIREMENTS.md"
-        with open(requirements_file, 'w') as f:
-            f.write(requirements_content)
+        # Final success message
+        out("\n" + "="*50)
+        out("🚀 Generation Complete")
+        out("="*50)
+        out(f"✅ Android project '{project_name}' has been successfully generated!")
         
-        print("✅ Requirements file generated: REQUIREMENTS.md")
-    except Exception as e:
-        print(f"⚠️  Could not generate requirements file: {e}")
-    
-    # Step 3: Clean up temporary files
-    print("📋 Step 3/3: Cleaning up temporary files")
-    temp_file = Path(project_dir) / "cookiecutter_context.json"
-    if temp_file.exists():
-        temp_file.unlink()
-        print("✅ Temporary files cleaned up")
-    
-    # Final success message
-    print("\n" + "="*50)
-    print("🚀 Generation Complete")
-    print("="*50)
-    print(f"✅ Android project '{project_name}' has been successfully generated!")
-    
-    # Display next steps
-    print("\n📌 Next Steps")
-    print("1. Open the project in Android Studio:")
-    print(f"   cd {project_name}")
-    print("   # Open Android Studio and select 'Open an existing project'")
-    
-    print("2. Sync the project with Gradle files")
-    print("3. Build and run the project")
-    print("4. Check REQUIREMENTS.md for environment details")
-    
-    # Display project info
-    if context:
-        print("\n📌 Project Information")
-        print(f"📱 App Name: {context.get('app_name', 'Unknown')}")
-        print(f"📦 Package: {context.get('package_name', 'Unknown')}")
-        print(f"🔢 Version: {context.get('version_name', 'Unknown')}")
-        print(f"👨‍💻 Author: {context.get('author_name', 'Unknown')}")
-        print(f"📧 Email: {context.get('author_email', 'Unknown')}")
-        print(f"🎯 Min SDK: {context.get('min_sdk', 'Unknown')}")
-        print(f"🎯 Target SDK: {context.get('target_sdk', 'Unknown')}")
-    
-    print("\n🎉 Happy Android Development!")
+        # Display next steps
+        out("\n📌 Next Steps")
+        out("1. Open the project in Android Studio:")
+        out(f"   cd {project_name}")
+        out("   # Open Android Studio and select 'Open an existing project'")
+        
+        out("2. Sync the project with Gradle files")
+        out("3. Build and run the project")
+        out("4. Check REQUIREMENTS.md for environment details")
+        
+        # Display project info
+        if context:
+            out("\n📌 Project Information")
+            out(f"📱 App Name: {context.get('app_name', 'Unknown')}")
+            out(f"📦 Package: {context.get('package_name', 'Unknown')}")
+            out(f"🔢 Version: {context.get('version_name', 'Unknown')}")
+            out(f"👨‍💻 Author: {context.get('author_name', 'Unknown')}")
+            out(f"📧 Email: {context.get('author_email', 'Unknown')}")
+            out(f"🎯 Min SDK: {context.get('min_sdk', 'Unknown')}")
+            out(f"🎯 Target SDK: {context.get('target_sdk', 'Unknown')}")
+        
+        out("\n🎉 Happy Android Development!")
+    finally:
+        # Emit anything still queued, including on sys.exit() or an error
+        flush_output()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -4,12 +4,262 @@ Validation system for Android Hello World template.
 Validates user inputs and environment requirements.
 """
 
+import functools
 import re
-import subprocess
+import shutil
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 from .logger import logger
 
+# Precompiled validation patterns
+_PROJECT_NAME_RE = re.compile(r'^[A-Za-z][A-Za-z0-9_]*$')
+_PACKAGE_NAME_RE = re.compile(r'^[a-z][a-z0-9_]*(\.[a-z][a-z0-9_]*)*$')
+_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+_SEMVER_RE = re.compile(r'^\d+\.\d+\.\d+(-[a-zA-Z0-9.-]+)?(\+[a-zA-Z0-9.-]+)?$')
+
+# Project names that might conflict with Android tooling
+_RESERVED_WORDS = frozenset({'android', 'test', 'main', 'java', 'kotlin', 'gradle'})
+
+# Common install locations, resolved once at import
+_HOME = Path.home()
+_SDK_PATHS = (
+    _HOME / "Library/Android/sdk",
+    _HOME / "Android/Sdk",
+    Path("C:/Users") / _HOME.name / "AppData/Local/Android/Sdk",
+)
+_STUDIO_PATHS = (
+    Path("/Applications/Android Studio.app"),
+    _HOME / "android-studio",
+    Path("C:/Program Files/Android/Android Studio"),
+)
+
+@functools.lru_cache(maxsize=1)
+def _probe_java() -> bool:
+    """Check whether a java executable is on the PATH."""
+    return shutil.which('java') is not None
+
+@functools.lru_cache(maxsize=1)
+def _probe_android_sdk() -> Optional[Path]:
+    """Return the first Android SDK found in common locations."""
+    return next((path for path in _SDK_PATHS if path.exists()), None)
+
+@functools.lru_cache(maxsize=1)
+def _probe_android_studio() -> bool:
+    """Check whether Android Studio is installed in a common location."""
+    return any(path.exists() for path in _STUDIO_PATHS)
+
+def _check_sdk_version(version: str, min_version: int, max_version: int) -> Optional[str]:
+    """Return the error for an SDK version, or None if it is in range."""
+    # JSON contexts may hold plain integers; normalise before the cache
+    # lookup, since 34, 34.0 and "34" would otherwise share results
+    return _check_sdk_version_str(str(version), min_version, max_version)
+
+@functools.lru_cache(maxsize=64)
+def _check_sdk_version_str(version: str, min_version: int, max_version: int) -> Optional[str]:
+    """Check an SDK version given as a string."""
+    if not version.isdecimal():
+        return f"SDK version '{version}' must be a valid integer"
+    
+    version_int = int(version)
+    if not min_version <= version_int <= max_version:
+        return f"SDK version {version_int} must be between {min_version} and {max_version}"
+    
+    return None
+
+def _validate_project_name(name: str, errors: List[str], warnings: List[str]) -> bool:
+    """Validate project name."""
+    if not name:
+        errors.append("Project name cannot be empty")
+        return False
+    
+    if not _PROJECT_NAME_RE.match(name):
+        errors.append("Project name must start with a letter and contain only letters, numbers, and underscores")
+        return False
+    
+    if len(name) > 50:
+        errors.append("Project name must be 50 characters or less")
+        return False
+    
+    # Check for reserved words
+    if name.lower() in _RESERVED_WORDS:
+        warnings.append(f"Project name '{name}' might conflict with Android reserved words")
+    
+    return True
+
+def _validate_package_name(package: str, errors: List[str], warnings: List[str]) -> bool:
+    """Validate package name."""
+    if not package:
+        errors.append("Package name cannot be empty")
+        return False
+    
+    # Android package name rules
+    if not _PACKAGE_NAME_RE.match(package):
+        errors.append("Package name must follow Java package naming conventions (e.g., com.example.app)")
+        return False
+    
+    if len(package) > 100:
+        errors.append("Package name must be 100 characters or less")
+        return False
+    
+    return True
+
+def _validate_sdk_version(version: str, errors: List[str], warnings: List[str],
+                          min_version: int = 21, max_version: int = 35) -> bool:
+    """Validate SDK version."""
+    error = _check_sdk_version(version, min_version, max_version)
+    if error:
+        errors.append(error)
+        return False
+    
+    return True
+
+def _validate_java_version(version: str, errors: List[str], warnings: List[str]) -> bool:
+    """Validate Java version."""
+    version = str(version)
+    if not version.isdecimal():
+        errors.append("Java version must be a valid integer")
+        return False
+    
+    if not 8 <= int(version) <= 21:
+        errors.append("Java version must be between 8 and 21")
+        return False
+    
+    return True
+
+def _validate_email(email: str, errors: List[str], warnings: List[str]) -> bool:
+    """Validate email address."""
+    if not email:
+        warnings.append("Email address is empty (optional but recommended)")
+        return True
+    
+    if not _EMAIL_RE.match(email):
+        errors.append("Invalid email address format")
+        return False
+    
+    return True
+
+def _validate_version_name(version: str, errors: List[str], warnings: List[str]) -> bool:
+    """Validate version name (semantic versioning)."""
+    if not version:
+        errors.append("Version name cannot be empty")
+        return False
+    
+    # Semantic versioning pattern
+    if not _SEMVER_RE.match(version):
+        warnings.append("Version name should follow semantic versioning (e.g., 1.0.0)")
+    
+    return True
+
+def _validate_environment(errors: List[str], warnings: List[str]) -> bool:
+    """Validate development environment."""
+    logger.subsection("Environment Validation")
+    
+    # Check Java
+    if _probe_java():
+        logger.success("Java is installed")
+    else:
+        errors.append("Java is not installed")
+    
+    # Check Android SDK
+    sdk_path = _probe_android_sdk()
+    if sdk_path:
+        logger.success(f"Android SDK found at: {sdk_path}")
+    else:
+        warnings.append("Android SDK not found in common locations")
+    
+    # Check Android Studio
+    if _probe_android_studio():
+        logger.success("Android Studio is installed")
+    else:
+        warnings.append("Android Studio not found in common locations")
+    
+    return len(errors) == 0
+
+# Required fields as (field, validator, extra arguments)
+_FIELD_VALIDATORS = (
+    ('project_name', _validate_project_name, ()),
+    ('package_name', _validate_package_name, ()),
+    ('min_sdk', _validate_sdk_version, (21, 35)),
+    ('target_sdk', _validate_sdk_version, (21, 35)),
+    ('compile_sdk', _validate_sdk_version, (21, 35)),
+    ('java_version', _validate_java_version, ()),
+    ('version_name', _validate_version_name, ()),
+)
+
+# Context keys that affect the validation result
+_CONTEXT_KEYS = tuple(field for field, _, _ in _FIELD_VALIDATORS) + ('author_email',)
+
+@functools.lru_cache(maxsize=128)
+def _validate_inputs(frozen_context: Tuple[Tuple[str, type, str], ...]) -> Tuple[Tuple[str, ...], Tuple[str, ...], Tuple[str, ...]]:
+    """Validate a frozen context and return (errors, warnings, failed fields).
+    
+    The context is frozen as (key, type, value) triples so that equal
+    values of different types, such as 34 and 34.0, are cached separately.
+    This does no logging, so cached results are safe to reuse.
+    """
+    context = {key: value for key, _, value in frozen_context}
+    errors = []
+    warnings = []
+    failed_fields = []
+    
+    # Validate required fields, checking each distinct value only once
+    # (min, target and compile SDK frequently share a value). The type is
+    # part of the key because e.g. 34 and 34.0 compare equal but are judged
+    # differently.
+    checked = {}
+    for field, validator, extra_args in _FIELD_VALIDATORS:
+        if field in context:
+            value = context[field]
+            key = (validator, type(value), value, extra_args)
+            if key not in checked:
+                checked[key] = validator(value, errors, warnings, *extra_args)
+            if not checked[key]:
+                failed_fields.append(field)
+        else:
+            errors.append(f"Required field '{field}' is missing")
+    
+    # Validate optional fields
+    if 'author_email' in context:
+        _validate_email(context['author_email'], errors, warnings)
+    
+    return tuple(errors), tuple(warnings), tuple(failed_fields)
+
+def _validate_context(context: Dict[str, str], errors: List[str], warnings: List[str]) -> bool:
+    """Validate a context, appending to errors and warnings, and log the results."""
+    logger.section("Template Validation")
+    
+    frozen_context = tuple(
+        (key, type(context[key]), context[key]) for key in _CONTEXT_KEYS if key in context
+    )
+    input_errors, input_warnings, failed_fields = _validate_inputs(frozen_context)
+    for field in failed_fields:
+        logger.error(f"Validation failed for {field}: {context[field]}")
+    
+    errors.extend(input_errors)
+    warnings.extend(input_warnings)
+    
+    # Validate environment only once the inputs are known to be good
+    if not errors:
+        _validate_environment(errors, warnings)
+    
+    _log_results(errors, warnings)
+    return len(errors) == 0
+
+def _log_results(errors: List[str], warnings: List[str]):
+    """Log a summary of validation errors and warnings."""
+    if errors:
+        logger.error(f"Found {len(errors)} validation errors")
+        for error in errors:
+            logger.error(f"  - {error}")
+    
+    if warnings:
+        logger.warning(f"Found {len(warnings)} warnings")
+        for warning in warnings:
+            logger.warning(f"  - {warning}")
+    
+    if not errors and not warnings:
+        logger.success("All validations passed successfully!")
+
 class AndroidTemplateValidator:
     """Validator for Android template inputs and environment."""
     
@@ -20,190 +270,44 @@ class AndroidTemplateValidator:
     
     def validate_project_name(self, name: str) -> bool:
         """Validate project name."""
-        if not name:
-            self.errors.append("Project name cannot be empty")
-            return False
-        
-        if not re.match(r'^[A-Za-z][A-Za-z0-9_]*$', name):
-            self.errors.append("Project name must start with a letter and contain only letters, numbers, and underscores")
-            return False
-        
-        if len(name) > 50:
-            self.errors.append("Project name must be 50 characters or less")
-            return False
-        
-        # Check for reserved words
-        reserved_words = ['android', 'test', 'main', 'java', 'kotlin', 'gradle']
-        if name.lower() in reserved_words:
-            self.warnings.append(f"Project name '{name}' might conflict with Android reserved words")
-        
-        return True
+        return _validate_project_name(name, self.errors, self.warnings)
     
     def validate_package_name(self, package: str) -> bool:
         """Validate package name."""
-        if not package:
-            self.errors.append("Package name cannot be empty")
-            return False
-        
-        # Android package name rules
-        if not re.match(r'^[a-z][a-z0-9_]*(\.[a-z][a-z0-9_]*)*$', package):
-            self.errors.append("Package name must follow Java package naming conventions (e.g., com.example.app)")
-            return False
-        
-        if len(package) > 100:
-            self.errors.append("Package name must be 100 characters or less")
-            return False
-        
-        return True
+        return _validate_package_name(package, self.errors, self.warnings)
     
     def validate_sdk_version(self, version: str, min_version: int = 21, max_version: int = 35) -> bool:
         """Validate SDK version."""
-        try:
-            version_int = int(version)
-            if version_int < min_version or version_int > max_version:
-                self.errors.append(f"SDK version must be between {min_version} and {max_version}")
-                return False
-        except ValueError:
-            self.errors.append("SDK version must be a valid integer")
-            return False
-        
-        return True
+        return _validate_sdk_version(version, self.errors, self.warnings, min_version, max_version)
     
     def validate_java_version(self, version: str) -> bool:
         """Validate Java version."""
-        try:
-            version_int = int(version)
-            if version_int < 8 or version_int > 21:
-                self.errors.append("Java version must be between 8 and 21")
-                return False
-        except ValueError:
-            self.errors.append("Java version must be a valid integer")
-            return False
-        
-        return True
+        return _validate_java_version(version, self.errors, self.warnings)
     
     def validate_email(self, email: str) -> bool:
         """Validate email address."""
-        if not email:
-            self.warnings.append("Email address is empty (optional but recommended)")
-            return True
-        
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(email_pattern, email):
-            self.errors.append("Invalid email address format")
-            return False
-        
-        return True
+        return _validate_email(email, self.errors, self.warnings)
     
     def validate_version_name(self, version: str) -> bool:
         """Validate version name (semantic versioning)."""
-        if not version:
-            self.errors.append("Version name cannot be empty")
-            return False
-        
-        # Semantic versioning pattern
-        semver_pattern = r'^\d+\.\d+\.\d+(-[a-zA-Z0-9.-]+)?(\+[a-zA-Z0-9.-]+)?$'
-        if not re.match(semver_pattern, version):
-            self.warnings.append("Version name should follow semantic versioning (e.g., 1.0.0)")
-        
-        return True
+        return _validate_version_name(version, self.errors, self.warnings)
     
     def validate_environment(self) -> bool:
         """Validate development environment."""
-        logger.subsection("Environment Validation")
-        
-        # Check Java
-        try:
-            result = subprocess.run(['java', '-version'], capture_output=True, text=True, timeout=10)
-            if result.returncode == 0:
-                logger.success("Java is installed")
-            else:
-                self.errors.append("Java is not properly installed")
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            self.errors.append("Java is not installed")
-        
-        # Check Android SDK
-        sdk_paths = [
-            Path.home() / "Library/Android/sdk",
-            Path.home() / "Android/Sdk",
-            Path("C:/Users") / Path.home().name / "AppData/Local/Android/Sdk",
-        ]
-        
-        sdk_found = False
-        for sdk_path in sdk_paths:
-            if sdk_path.exists():
-                logger.success(f"Android SDK found at: {sdk_path}")
-                sdk_found = True
-                break
-        
-        if not sdk_found:
-            self.warnings.append("Android SDK not found in common locations")
-        
-        # Check Android Studio
-        studio_paths = [
-            "/Applications/Android Studio.app",
-            str(Path.home() / "android-studio"),
-            "C:/Program Files/Android/Android Studio",
-        ]
-        
-        studio_found = False
-        for studio_path in studio_paths:
-            if Path(studio_path).exists():
-                logger.success("Android Studio is installed")
-                studio_found = True
-                break
-        
-        if not studio_found:
-            self.warnings.append("Android Studio not found in common locations")
-        
-        return len(self.errors) == 0
+        return _validate_environment(self.errors, self.warnings)
     
     def validate_all(self, context: Dict[str, str]) -> Tuple[bool, List[str], List[str]]:
-        """Validate all template inputs."""
-        logger.section("Template Validation")
-        
-        # Validate required fields
-        required_fields = {
-            'project_name': self.validate_project_name,
-            'package_name': self.validate_package_name,
-            'min_sdk': lambda x: self.validate_sdk_version(x, 21, 35),
-            'target_sdk': lambda x: self.validate_sdk_version(x, 21, 35),
-            'compile_sdk': lambda x: self.validate_sdk_version(x, 21, 35),
-            'java_version': self.validate_java_version,
-            'version_name': self.validate_version_name,
-        }
-        
-        for field, validator in required_fields.items():
-            if field in context:
-                if not validator(context[field]):
-                    logger.error(f"Validation failed for {field}: {context[field]}")
-            else:
-                self.errors.append(f"Required field '{field}' is missing")
-        
-        # Validate optional fields
-        if 'author_email' in context:
-            self.validate_email(context['author_email'])
-        
-        # Validate environment
-        self.validate_environment()
-        
-        # Log results
-        if self.errors:
-            logger.error(f"Found {len(self.errors)} validation errors")
-            for error in self.errors:
-                logger.error(f"  - {error}")
-        
-        if self.warnings:
-            logger.warning(f"Found {len(self.warnings)} warnings")
-            for warning in self.warnings:
-                logger.warning(f"  - {warning}")
-        
-        if not self.errors and not self.warnings:
-            logger.success("All validations passed successfully!")
-        
-        return len(self.errors) == 0, self.errors, self.warnings
+        """Validate all template inputs, adding to any existing errors and warnings."""
+        is_valid = _validate_context(context, self.errors, self.warnings)
+        return is_valid, self.errors, self.warnings
 
 def validate_template_inputs(context: Dict[str, str]) -> Tuple[bool, List[str], List[str]]:
-    """Validate template inputs and return results."""
-    validator = AndroidTemplateValidator()
-    return validator.validate_all(context) 
\ No newline at end of file
+    """Validate template inputs and return results.
+    
+    Input validation results are cached per distinct set of validated
+    context values, so repeated calls with the same inputs skip it.
+    """
+    errors = []
+    warnings = []
+    is_valid = _validate_context(context, errors, warnings)
+    return is_valid, errors, warnings